@@ -1,7 +1,8 @@
 """
 reporter.py — Step 7 (polished)
-City Data Reporter: prompt for a city, fetch live weather from OpenWeatherMap,
-print a summary, write to CSV, and summarize the CSV contents.
+City Data Reporter: take one or more cities (--cities a,b,c, --cities - to read
+them from stdin, or an interactive prompt), fetch live weather from OpenWeatherMap,
+print a summary per city, append the rows to CSV, and summarize the CSV contents.
 
 - PEP 8 naming and structure
 - Docstrings and type hints
@@ -9,28 +10,196 @@ print a summary, write to CSV, and summarize the CSV contents.
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import atexit
+import copy
 import csv
+import io
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import quote, quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+try:  # Optional: faster JSON decoding.
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _loads = json.loads
+
+try:  # Optional: concurrent fetches for multi-city runs.
+    import aiohttp
+except ImportError:  # pragma: no cover - fall back to sequential requests
+    aiohttp = None
 
 API_BASE = "https://api.openweathermap.org/data/2.5/weather"
 TIMEOUT = 10
+UNITS = "metric"
+CACHE_TTL = 300  # seconds; OpenWeatherMap refreshes current weather every few minutes
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_TOTAL = 2
+RETRY_BACKOFF = 0.3  # urllib3 backoff_factor: no wait before the first retry, then 0.6 s
+MAX_WORKERS = 8  # thread fan-out for multi-city runs without aiohttp
 CSV_PATH = Path("city_data.csv")
+CACHE_PATH = Path(".owm_cache.json")  # responses persist across runs for CACHE_TTL
+_CSV_SPECIAL_CHARS = ',"\r\n'
+
+_tls = threading.local()
+_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+_cache_loaded = False
+_cache_dirty = False
+_csv_ready: Set[Path] = set()
+_appenders: Dict[Path, BinaryIO] = {}
+
+
+def _make_retry() -> Retry:
+    return Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+
+
+def _retry_delay(retry: Retry, retry_number: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry number N (1-based), computed as urllib3's Retry.sleep() does."""
+    if retry_after is not None:
+        try:
+            return retry.parse_retry_after(retry_after)
+        except InvalidHeader:
+            pass
+    if retry_number <= 1:
+        return 0.0
+    return min(retry.backoff_max, retry.backoff_factor * 2 ** (retry_number - 1))
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's HTTP session, creating it on first use (keeps connections alive)."""
+    session = getattr(_tls, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=4, max_retries=_make_retry()))
+        _tls.session = session
+    return session
+
+
+@lru_cache(maxsize=None)
+def _url_template(api_key: str) -> str:
+    """Build the request URL once per API key; only the city varies between calls."""
+    return f"{API_BASE}?appid={quote(api_key, safe='')}&units={UNITS}&q={{q}}"
+
+
+def _weather_url(city: str, api_key: str) -> str:
+    return _url_template(api_key).format(q=quote_plus(city))
+
+
+def _cache_key(city: str) -> Tuple[str, str]:
+    return (city.casefold(), UNITS)
+
+
+def _load_cache() -> None:
+    """Read unexpired entries from CACHE_PATH once per process; a missing or bad file means an empty cache."""
+    global _cache_loaded
+    with _cache_lock:
+        if _cache_loaded:
+            return
+        _cache_loaded = True
+        atexit.register(_save_cache)
+        try:
+            entries = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+            now = time.time()
+            for city, units, stored_at, payload in entries:
+                if now - stored_at <= CACHE_TTL:
+                    _CACHE[(city, units)] = (stored_at, payload)
+        except (OSError, ValueError, TypeError):
+            pass
+
+
+def _save_cache() -> None:
+    """Write unexpired entries back to CACHE_PATH if anything was added this run."""
+    if not _cache_dirty:
+        return
+    now = time.time()
+    entries = [
+        [city, units, stored_at, payload]
+        for (city, units), (stored_at, payload) in _CACHE.items()
+        if now - stored_at <= CACHE_TTL
+    ]
+    tmp = CACHE_PATH.with_name(CACHE_PATH.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(entries), encoding="utf-8")
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        pass  # the cache is only an optimization
+
+
+def _cache_get(city: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached payload for the city if it is younger than CACHE_TTL."""
+    _load_cache()
+    entry = _CACHE.get(_cache_key(city))
+    if entry is None or time.time() - entry[0] > CACHE_TTL:
+        return None
+    return copy.deepcopy(entry[1])
+
+
+def _cache_put(city: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    global _cache_dirty
+    _load_cache()
+    _CACHE[_cache_key(city)] = (time.time(), copy.deepcopy(payload))
+    _cache_dirty = True
+    return payload
+
+
+def normalize_city(city: str) -> str:
+    """Trim and collapse runs of whitespace, so ' New  York ' and 'New York' share a cache entry."""
+    return " ".join(city.split())
 
 
 def get_city_input() -> str:
     """Prompt until a non-empty city name is entered."""
     while True:
-        city = input("Enter a city name: ").strip()
+        city = normalize_city(input("Enter a city name: "))
         if city:
             return city
         print("City name cannot be empty. Please try again.")
 
 
+def _decode_response(status: int, body: bytes, city: str) -> Dict[str, Any]:
+    """
+    Turn an OpenWeatherMap response into its JSON payload, decoding the body at most once.
+
+    Raises:
+        RuntimeError: On 401/404, any other error status, or a body that is not valid JSON.
+    """
+    if status == 401:
+        raise RuntimeError("Unauthorized (401): invalid API key.")
+    if status == 404:
+        raise RuntimeError(f"City not found (404): '{city}'.")
+
+    try:
+        parsed = _loads(body)
+    except ValueError:
+        parsed = None
+
+    if status >= 400:
+        detail = parsed.get("message", "") if isinstance(parsed, dict) else ""
+        raise RuntimeError(f"OpenWeather error {status}: {detail or 'Unexpected error.'}")
+    if not isinstance(parsed, dict):
+        raise RuntimeError("Response was not valid JSON.")
+    return parsed
+
+
 def fetch_weather(city: str, api_key: str) -> Dict[str, Any]:
     """
     Fetch weather data from OpenWeatherMap.
@@ -41,28 +210,138 @@ def fetch_weather(city: str, api_key: str) -> Dict[str, Any]:
     if not api_key:
         raise RuntimeError("Missing OPENWEATHER_API_KEY. See README for setup.")
 
-    params = {"q": city, "appid": api_key, "units": "metric"}
+    cached = _cache_get(city)
+    if cached is not None:
+        return cached
+
     try:
-        resp = requests.get(API_BASE, params=params, timeout=TIMEOUT)
+        resp = _get_session().get(_weather_url(city, api_key), timeout=TIMEOUT)
     except requests.RequestException as exc:
         raise RuntimeError(f"Network error: {exc}") from exc
 
-    if resp.status_code == 401:
-        raise RuntimeError("Unauthorized (401): invalid API key.")
-    if resp.status_code == 404:
-        raise RuntimeError(f"City not found (404): '{city}'.")
-    if not resp.ok:
-        detail = ""
+    return _cache_put(city, _decode_response(resp.status_code, resp.content, city))
+
+
+async def fetch_weather_async(session: "aiohttp.ClientSession", city: str, api_key: str) -> Dict[str, Any]:
+    """
+    Async counterpart of fetch_weather using an aiohttp session.
+
+    Raises:
+        RuntimeError: If the API key is missing, city not found, or network/API issues occur.
+    """
+    if not api_key:
+        raise RuntimeError("Missing OPENWEATHER_API_KEY. See README for setup.")
+
+    cached = _cache_get(city)
+    if cached is not None:
+        return cached
+
+    url = _weather_url(city, api_key)
+    # Mirror the requests adapter's Retry: connection/read errors and transient statuses
+    # share one budget, with the same backoff and Retry-After handling.
+    retry = _make_retry()
+    for attempt in range(retry.total + 1):
+        retry_after = None
         try:
-            detail = resp.json().get("message", "")
-        except Exception:
-            pass
-        raise RuntimeError(f"OpenWeather error {resp.status_code}: {detail or 'Unexpected error.'}")
+            async with session.get(url) as resp:
+                status, body = resp.status, await resp.read()
+                if status in Retry.RETRY_AFTER_STATUS_CODES:
+                    retry_after = resp.headers.get("Retry-After")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            if attempt == retry.total:
+                raise RuntimeError(f"Network error: {exc}") from exc
+        else:
+            if status not in retry.status_forcelist or attempt == retry.total:
+                break
+        await asyncio.sleep(_retry_delay(retry, attempt + 1, retry_after))
+
+    return _cache_put(city, _decode_response(status, body, city))
 
+
+async def _fetch_all(cities: Sequence[str], api_key: str) -> List[Any]:
+    """Fetch all cities concurrently on one event loop; failures are returned, not raised."""
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=TIMEOUT),
+        connector=aiohttp.TCPConnector(limit=16, limit_per_host=8),
+    ) as session:
+        return await asyncio.gather(
+            *(fetch_weather_async(session, city, api_key) for city in cities), return_exceptions=True
+        )
+
+
+def _fetch_or_error(city: str, api_key: str) -> Union[Dict[str, Any], RuntimeError]:
     try:
-        return resp.json()
-    except ValueError as exc:
-        raise RuntimeError("Response was not valid JSON.") from exc
+        return fetch_weather(city, api_key)
+    except RuntimeError as err:
+        return err
+
+
+def fetch_weather_many(cities: Iterable[str], api_key: str) -> List[Union[Dict[str, Any], RuntimeError]]:
+    """
+    Fetch weather data for several cities, in order.
+
+    Requests run concurrently on one event loop when aiohttp is installed,
+    otherwise on a thread pool with one keep-alive session per worker.
+    Cities that repeat (or are still cached) are only requested once.
+    Returns:
+        One entry per city: the payload, or the RuntimeError raised for that city.
+    Raises:
+        RuntimeError: If the API key is missing (regardless of what is cached).
+    """
+    if not api_key:
+        raise RuntimeError("Missing OPENWEATHER_API_KEY. See README for setup.")
+
+    cities = list(cities)
+    by_key: Dict[Tuple[str, str], Any] = {}
+    unique: Dict[Tuple[str, str], str] = {}
+    for city in cities:
+        key = _cache_key(city)
+        if key in by_key or key in unique:
+            continue
+        cached = _cache_get(city)
+        if cached is not None:
+            by_key[key] = cached
+        else:
+            unique[key] = city
+    pending = list(unique.values())
+    if aiohttp is not None and len(pending) > 1:
+        results = asyncio.run(_fetch_all(pending, api_key))
+    elif len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pending))) as ex:
+            results = list(ex.map(lambda c: _fetch_or_error(c, api_key), pending))
+    else:
+        results = [_fetch_or_error(c, api_key) for c in pending]
+
+    for city, result in zip(pending, results):
+        if isinstance(result, BaseException) and not isinstance(result, RuntimeError):
+            raise result
+        by_key[_cache_key(city)] = result
+    return [by_key[_cache_key(c)] for c in cities]
+
+
+def _describe_bad_payload(payload: Any) -> str:
+    """Name the first missing or malformed field; only called once parsing has failed."""
+    if not isinstance(payload, dict):
+        return "API payload is not a JSON object."
+    main_ = payload.get("main")
+    if not isinstance(main_, dict):
+        return "API payload missing expected field: main"
+    sys_ = payload.get("sys")
+    if not isinstance(sys_, dict):
+        return "API payload missing expected field: sys"
+    weather = payload.get("weather")
+    if not isinstance(weather, list) or not weather or not isinstance(weather[0], dict):
+        return "API payload missing expected field: weather"
+    for name, value in (
+        ("name", payload.get("name")),
+        ("sys.country", sys_.get("country")),
+        ("main.temp", main_.get("temp")),
+        ("main.humidity", main_.get("humidity")),
+        ("weather[0].description", weather[0].get("description")),
+    ):
+        if value is None:
+            return f"API payload missing expected field: {name}"
+    return "API payload has non-numeric temperature or humidity."
 
 
 def parse_weather(payload: Dict[str, Any]) -> Dict[str, str]:
@@ -72,75 +351,168 @@ def parse_weather(payload: Dict[str, Any]) -> Dict[str, str]:
         Dict with keys: City, Country, Temperature (C), Humidity (%), Description
     """
     try:
+        main_ = payload["main"]
         city = payload["name"]
         country = payload["sys"]["country"]
-        temp_c = float(payload["main"]["temp"])
-        humidity = int(payload["main"]["humidity"])
-        description = str(payload["weather"][0]["description"])
+        temp_c = float(main_["temp"])
+        humidity = int(main_["humidity"])
+        description = payload["weather"][0]["description"]
     except (KeyError, IndexError, TypeError, ValueError) as exc:
-        raise RuntimeError("API payload missing expected fields.") from exc
+        raise RuntimeError(_describe_bad_payload(payload)) from exc
+    # JSON nulls index fine; treat them as missing, just like _describe_bad_payload does.
+    if city is None or country is None or description is None:
+        raise RuntimeError(_describe_bad_payload(payload))
 
     return {
         "City": city,
         "Country": country,
         "Temperature (C)": f"{temp_c:.1f}",
         "Humidity (%)": str(humidity),
-        "Description": description,
+        "Description": str(description),
     }
 
 
 def ensure_csv_headers(path: Path) -> None:
-    """Create CSV with headers if not present or empty."""
+    """Create CSV with headers if not present or empty (checked once per path per process)."""
+    if path in _csv_ready:
+        return
     headers = ["City", "Country", "Temperature (C)", "Humidity (%)", "Description"]
-    if not path.exists() or path.stat().st_size == 0:
-        with path.open("w", newline="", encoding="utf-8") as f:
+    # One open() instead of exists() + stat(): append mode creates the file if needed,
+    # lands at the end, and never truncates rows another process may have written.
+    with path.open("a", newline="", encoding="utf-8") as f:
+        if f.tell() == 0:
             csv.writer(f).writerow(headers)
+    _csv_ready.add(path)
+
+
+def _close_appenders() -> None:
+    for f in _appenders.values():
+        f.close()
+    _appenders.clear()
+
+
+def _get_appender(path: Path) -> BinaryIO:
+    """Return a buffered binary append handle for the CSV, kept open until interpreter exit."""
+    f = _appenders.get(path)
+    if f is None:
+        if not _appenders:
+            atexit.register(_close_appenders)
+        f = _appenders[path] = open(path, "ab", buffering=1 << 16)
+    return f
+
+
+def write_rows_to_csv(rows: Sequence[Dict[str, str]], path: Path = CSV_PATH) -> None:
+    """Append several rows to the CSV in one buffered write, ensuring headers exist."""
+    if not rows:
+        return
+    ensure_csv_headers(path)
+    lines = []
+    quoted = None
+    for r in rows:
+        values = (r["City"], r["Country"], r["Temperature (C)"], r["Humidity (%)"], r["Description"])
+        if not all(type(v) is str for v in values) or any(c in v for v in values for c in _CSV_SPECIAL_CHARS):
+            # Non-str fields, or City/Description with commas or quotes: let the csv module
+            # format them exactly as before.
+            if quoted is None:
+                quoted = io.StringIO()
+                writer = csv.writer(quoted)
+            writer.writerow(values)
+            lines.append(quoted.getvalue())
+            quoted.seek(0)
+            quoted.truncate()
+        else:
+            lines.append(",".join(values) + "\r\n")  # same line terminator as csv.writer
+    f = _get_appender(path)
+    f.write("".join(lines).encode("utf-8"))
+    f.flush()
 
 
 def write_row_to_csv(row: Dict[str, str], path: Path = CSV_PATH) -> None:
     """Append a row to the CSV, ensuring headers exist."""
-    ensure_csv_headers(path)
-    with path.open("a", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow(
-            [row["City"], row["Country"], row["Temperature (C)"], row["Humidity (%)"], row["Description"]]
-        )
+    write_rows_to_csv([row], path)
 
 
 def summarize_csv(path: Path = CSV_PATH) -> Optional[str]:
     """Return a human-readable summary of the CSV contents, or None if empty/missing."""
     if not path.exists():
         return None
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    if not rows:
+    with path.open("r", newline="", encoding="utf-8", buffering=1 << 16) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return None
+        ci = header.index("City") if "City" in header else len(header)
+        ti = header.index("Temperature (C)") if "Temperature (C)" in header else len(header)
+        lines = []
+        for row in reader:
+            if not row:
+                continue
+            city = row[ci] if ci < len(row) else "?"
+            temp = row[ti] if ti < len(row) else "?"
+            lines.append(f"- {city} — {temp} °C")
+    if not lines:
         return None
-    lines = [f"Total entries: {len(rows)}"]
-    for r in rows:
-        lines.append(f"- {r.get('City','?')} — {r.get('Temperature (C)','?')} °C")
-    return "\n".join(lines)
+    return "\n".join([f"Total entries: {len(lines)}", *lines])
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Report live weather for one or more cities.")
+    parser.add_argument(
+        "--cities",
+        help="Comma-separated list of cities (e.g. 'London,Paris'), or '-' to read one per line "
+        "from stdin. If omitted, you are prompted for a city.",
+    )
+    return parser.parse_args(argv)
+
+
+def get_cities(args: argparse.Namespace) -> List[str]:
+    """Resolve the cities to report from --cities, stdin (--cities -), or an interactive prompt."""
+    if args.cities is None:
+        return [get_city_input()]
+    if args.cities == "-":
+        cities = [normalize_city(line) for line in sys.stdin]
+    else:
+        cities = [normalize_city(c) for c in args.cities.split(",")]
+    cities = [c for c in cities if c]
+    if not cities:
+        print("[ERROR] No city names given.")
+        sys.exit(1)
+    return cities
 
 
-def main() -> None:
-    """Entrypoint: prompt, fetch, parse, print, save, summarize."""
-    city = get_city_input()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entrypoint: read cities, fetch, parse, print, save, summarize."""
+    cities = get_cities(parse_args(argv))
     api_key = os.getenv("OPENWEATHER_API_KEY", "")
 
     try:
-        data = parse_weather(fetch_weather(city, api_key))
+        results = fetch_weather_many(cities, api_key)
     except RuntimeError as err:
         print(f"[ERROR] {err}")
         sys.exit(1)
 
-    print(
-        f"\nCurrent weather for {data['City']}, {data['Country']}:\n"
-        f"- Temperature: {data['Temperature (C)']} °C\n"
-        f"- Humidity: {data['Humidity (%)']}%\n"
-        f"- Description: {data['Description']}\n"
-    )
+    rows = []
+    for city, result in zip(cities, results):
+        try:
+            if isinstance(result, RuntimeError):
+                raise result
+            rows.append(parse_weather(result))
+        except RuntimeError as err:
+            print(f"[ERROR] {city}: {err}" if len(cities) > 1 else f"[ERROR] {err}")
+    if not rows:
+        sys.exit(1)
+
+    for data in rows:
+        print(
+            f"\nCurrent weather for {data['City']}, {data['Country']}:\n"
+            f"- Temperature: {data['Temperature (C)']} °C\n"
+            f"- Humidity: {data['Humidity (%)']}%\n"
+            f"- Description: {data['Description']}\n"
+        )
 
     try:
-        write_row_to_csv(data, CSV_PATH)
+        write_rows_to_csv(rows, CSV_PATH)
         print(f"Saved to {CSV_PATH.resolve()}")
     except OSError as err:
         print(f"[WARNING] Could not write to CSV: {err}")